@@ -3,37 +3,98 @@ from fastapi.security import OAuth2PasswordBearer
 from google.oauth2 import id_token
 from google.auth.transport import requests
 import os
-from jose import JWTError, jwt
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from jose import JWTError, jwk, jwt
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Optional
 from models.auth import UserInfo, TokenPayload
-import json
-from pathlib import Path
 import uuid
 
 # Constants
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 ALGORITHM = os.environ.get("JWT_ALGORITHM", "HS256")
-DATA_DIR = os.environ.get("DATA_DIR")
+JWT_SECRET = os.environ.get("JWT_SECRET")
+GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID")
+TOKEN_CACHE_SIZE = int(os.environ.get("TOKEN_CACHE_SIZE", "1024"))
+GOOGLE_TOKEN_CACHE_SIZE = int(os.environ.get("GOOGLE_TOKEN_CACHE_SIZE", "4096"))
+GOOGLE_TOKEN_CACHE_TTL = int(os.environ.get("GOOGLE_TOKEN_CACHE_TTL", "300"))
+
+# Signing key built once so jose doesn't re-prepare the secret on every encode/decode
+_jwt_key = jwk.construct(JWT_SECRET, ALGORITHM) if JWT_SECRET else None
 
 # Initialize OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+class _TokenCache:
+    """Bounded LRU cache of verified tokens, keyed by the token's SHA-256 digest.
+    
+    Entries carry their own expiry so a cached token never outlives its `exp` claim.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, tuple[UserInfo, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+    
+    def get(self, token: str) -> Optional[UserInfo]:
+        """Return the cached user for a token, or None if missing or expired."""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return user
+    
+    def put(self, token: str, user: UserInfo, expires_at: float) -> None:
+        """Cache a verified user until `expires_at` (epoch seconds)."""
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (user, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+_session_token_cache = _TokenCache(TOKEN_CACHE_SIZE)
+_google_token_cache = _TokenCache(GOOGLE_TOKEN_CACHE_SIZE)
+
+# Shared transport so the HTTP session (and its connection pool) to Google is reused
+_google_request = requests.Request()
+
 def verify_google_token(token: str) -> UserInfo:
     """Verifies Google's ID token and returns user info."""
+    cached_user = _google_token_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+    
     try:
         idinfo = id_token.verify_oauth2_token(
-            token, requests.Request(), os.environ.get("GOOGLE_CLIENT_ID")
+            token, _google_request, GOOGLE_CLIENT_ID
         )
         
         if idinfo["iss"] not in ["accounts.google.com", "https://accounts.google.com"]:
             raise ValueError("Invalid issuer")
             
-        return UserInfo(
+        user = UserInfo(
             email=idinfo["email"],
             name=idinfo["name"],
             picture=idinfo.get("picture")
         )
+        # Never cache beyond the ID token's own expiry
+        expires_at = min(time.time() + GOOGLE_TOKEN_CACHE_TTL, idinfo["exp"])
+        _google_token_cache.put(token, user, expires_at)
+        return user
     except ValueError:
         raise HTTPException(
             status_code=401,
@@ -55,24 +116,30 @@ def create_access_token(user: UserInfo) -> str:
     
     return jwt.encode(
         token_data.model_dump(),
-        os.environ.get("JWT_SECRET"),
+        _jwt_key,
         algorithm=ALGORITHM
     )
 
 def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInfo:
     """Validates JWT token and returns current user."""
+    cached_user = _session_token_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+    
     try:
         payload = jwt.decode(
             token,
-            os.environ.get("JWT_SECRET"),
+            _jwt_key,
             algorithms=[ALGORITHM]
         )
         token_data = TokenPayload(**payload)
         
-        return UserInfo(
+        user = UserInfo(
             email=token_data.sub,
             name=token_data.name
         )
+        _session_token_cache.put(token, user, token_data.exp)
+        return user
     except JWTError:
         raise HTTPException(
             status_code=401,
@@ -1,15 +1,27 @@
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
+from fastapi.responses import JSONResponse, Response
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 import os
-import json
+import hashlib
+import stat
+import tempfile
+import asyncio
+import logging
+import orjson
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+# Load environment variables before importing modules that read them at import time
+load_dotenv()
+
 from models.gem import Gem, GemListItem
 from models.gem_types import GemEffectType
-from models.auth import TokenResponse, UserInfo
+from models.auth import GoogleAuthRequest, TokenResponse, UserInfo
 from auth.oauth import (
     verify_google_token,
     create_access_token,
@@ -17,35 +29,77 @@ from auth.oauth import (
 )
 from fastapi.responses import RedirectResponse
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the gem corpus into memory and keep it in sync while serving."""
+    await load_all_gems()
+    
+    # A missing data directory is not fatal (the API serves an empty corpus),
+    # but there is nothing to watch until the app is restarted with one
+    if not DATA_DIR.exists():
+        logger.warning("Not watching %s for changes: directory not found", DATA_DIR)
+        yield
+        return
+    
+    observer = Observer()
+    observer.schedule(GemFileHandler(asyncio.get_running_loop()), str(DATA_DIR), recursive=True)
+    observer.start()
+    try:
+        yield
+    finally:
+        observer.stop()
+        observer.join()
 
 # Initialize FastAPI app with metadata
 app = FastAPI(
     title="Diablo Immortal Gems API",
-    description="API for managing Diablo Immortal gem data"
+    description="API for managing Diablo Immortal gem data",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    print(f"Request: {request.method} {request.url}")
-    print(f"Headers: {request.headers}")
-    response = await call_next(request)
-    print(f"Response status: {response.status_code}")
-    return response
-
-@app.middleware("http")
-async def security_headers(request: Request, call_next):
-    response = await call_next(request)
+class SecurityHeadersMiddleware:
+    """Add security headers for cross-origin communication to every response.
+    
+    A plain ASGI middleware that patches the headers as the response starts,
+    instead of the task and stream wrapper BaseHTTPMiddleware adds per request.
+    """
     
-    # Set security headers for cross-origin communication
-    response.headers["Cross-Origin-Resource-Policy"] = "cross-origin"
+    HEADERS = [(b"cross-origin-resource-policy", b"cross-origin")]
     
-    return response
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value) for name, value in message.get("headers", [])
+                    if name.lower() != b"cross-origin-resource-policy"
+                ]
+                headers.extend(self.HEADERS)
+                message["headers"] = headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_headers)
+
+app.add_middleware(SecurityHeadersMiddleware)
 
 # Enable CORS for configured origins
 origins = os.getenv("CORS_ORIGINS", "https://dibo-gems.dukes.io").split(",")
-print(f"CORS_ORIGINS env var: {origins}")
+logger.debug("CORS origins: %s", origins)
 
 app.add_middleware(
     CORSMiddleware,
@@ -57,88 +111,86 @@ app.add_middleware(
 )
 
 # Data directory path (relative to backend directory)
-DATA_DIR = Path(os.path.join(os.path.dirname(__file__),"data"))
-
-class Effect(BaseModel):
-    """Represents a gem effect with its type, description, and conditions."""
-    type: str = Field(..., description="Type of the effect")
-    description: str = Field(..., description="Description of the effect")
-    conditions: List[str] = Field(default_factory=list, description="Conditions for the effect")
-    
-    class Config:
-        extra = "allow"
-        json_schema_extra = {
-            "examples": [
-                {
-                    "type": "resonance",
-                    "description": "Increases damage",
-                    "conditions": ["When health is above 50%"]
-                }
-            ]
-        }
-
-class Rank(BaseModel):
-    """Represents a gem rank with its effects."""
-    effects: List[Effect] = Field(..., description="List of effects at this rank")
-    
-    class Config:
-        extra = "allow"
-
-class GemMetadata(BaseModel):
-    """Metadata information for a gem."""
-    version: str = Field(..., description="Version of the gem data")
-    last_updated: str = Field(..., description="Last update timestamp")
-    
-    class Config:
-        extra = "allow"
-
-class Gem(BaseModel):
-    """Represents a complete gem with all its attributes."""
-    metadata: GemMetadata = Field(..., description="Gem metadata")
-    name: str = Field(..., description="Name of the gem")
-    stars: str = Field(..., description="Star rating of the gem")
-    description: str = Field(default="", description="Description of the gem")
-    ranks: Dict[str, Rank] = Field(..., description="Ranks and their effects")
-    file_path: str = Field(..., description="Path to the gem's JSON file")
-    
-    class Config:
-        extra = "allow"
-
-class GemListItem(BaseModel):
-    """Basic information about a gem for list views."""
-    name: str = Field(..., description="Name of the gem")
-    stars: int = Field(..., description="Star rating of the gem")
-    description: str = Field(..., description="Brief description of the gem")
-    effects: List[str] = Field(default_factory=list, description="List of main effects")
-    file_path: str = Field(..., description="Path to the gem's JSON file")
-
-    class Config:
-        extra = "allow"
-
-class GoogleAuthRequest(BaseModel):
-    """Request model for Google OAuth authentication."""
-    credential: str = Field(..., description="Google OAuth credential token")
+DATA_DIR = Path(os.path.join(os.path.dirname(os.path.abspath(__file__)),"data"))
+# Prefix stripped from absolute file paths to get their path relative to DATA_DIR
+_DATA_DIR_PREFIX = str(DATA_DIR) + os.sep
+# Star directories by name, one per possible leading digit of a gem path
+STAR_DIRS = {f"{n}star": DATA_DIR / f"{n}star" for n in range(10)}
+
+# Browsers may keep gem responses but must revalidate them, which is a cheap
+# 304 while nothing has changed and never shows stale data after an edit
+GEM_CACHE_CONTROL = "no-cache"
+
+class CachedBody(NamedTuple):
+    """A serialized JSON response body together with its ETag."""
+    body: bytes
+    etag: str
+
+def cached_body(content: Any) -> CachedBody:
+    """Serialize content and derive a strong ETag from the resulting bytes."""
+    body = orjson.dumps(content)
+    return CachedBody(body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+
+def cached_response(request: Request, cached: CachedBody) -> Response:
+    """Return the cached body, or 304 Not Modified if the client already has it."""
+    headers = {"ETag": cached.etag, "Cache-Control": GEM_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if cached.etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+# In-memory gem store, keyed by path relative to DATA_DIR (e.g. "5star/stormvault.json")
+_GEMS: Dict[str, Gem] = {}
+# The same gems grouped by star directory and gem name, as served by /export
+_GEMS_BY_STAR: Dict[str, Dict[str, Gem]] = {}
+# Serialized responses derived from the store; each is cached until the part of
+# the store it covers changes and rebuilt on the next request
+_export_cache: Optional[bytes] = None
+_gem_list_cache: Optional[CachedBody] = None
+# Serialized GET /gems/{path} bodies, keyed like _GEMS and dropped when that gem changes
+_gem_json_cache: Dict[str, CachedBody] = {}
+# (st_mtime_ns, st_size) of the last file save_gem wrote for each gem, so the
+# watcher can tell our own saves from outside edits
+_saved_stats: Dict[str, Tuple[int, int]] = {}
+
+# str.translate table for ASCII names: the fixed substitutions, with every other
+# character that is not alphanumeric or '_' dropped
+_SNAKE_TABLE = str.maketrans({" ": "_", "'": None, "&": "and", "-": "_"})
+for _c in map(chr, range(128)):
+    if not (_c.isalnum() or _c == '_'):
+        _SNAKE_TABLE.setdefault(ord(_c), None)
 
 def convert_to_snake_case(s: str) -> str:
     """Convert a string to snake_case, handling gem names correctly."""
     # Remove the rank prefix (e.g. "1-", "2-", "5-")
-    if s[0].isdigit() and s[1] == '-':
+    if s[:1].isdigit() and s[1:2] == '-':
         s = s[2:]
     
-    # Convert to lowercase and replace special characters
-    s = s.lower().replace(" ", "_").replace("'", "").replace("&", "and").replace("-", "_")
-    
-    # Keep only alphanumeric and underscore characters
-    s = ''.join(c for c in s if c.isalnum() or c == '_')
+    # Lowercase, replace special characters, and keep only alphanumerics and '_'
+    s = s.lower()
+    if s.isascii():
+        return s.translate(_SNAKE_TABLE)
+    s = s.replace(" ", "_").replace("'", "").replace("&", "and").replace("-", "_")
+    return ''.join(c for c in s if c.isalnum() or c == '_')
+
+def relative_gem_path(path: str) -> Optional[str]:
+    """Return a path relative to DATA_DIR, or None if it lies outside it.
     
-    return s
+    A plain string slice, avoiding the PurePath allocations of Path.relative_to.
+    Separators are normalized to '/', the form used for store keys and URLs.
+    """
+    if not path.startswith(_DATA_DIR_PREFIX):
+        return None
+    return path[len(_DATA_DIR_PREFIX):].replace(os.sep, '/')
 
 def load_gem(file_path: Path) -> Gem:
     """Load a gem from a JSON file."""
     try:
-        with open(file_path) as f:
-            data = json.load(f)
-            data['file_path'] = str(file_path.relative_to(DATA_DIR))
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
+            data['file_path'] = relative_gem_path(str(file_path))
             return Gem.model_validate(data)
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Error loading gem: {str(e)}")
@@ -146,66 +198,273 @@ def load_gem(file_path: Path) -> Gem:
 def save_gem(file_path: Path, gem: Gem) -> None:
     """Save a gem to a JSON file."""
     try:
-        # Remove file_path before saving to JSON
-        data = gem.model_dump()
-        data.pop('file_path', None)
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Serialize straight from the model, leaving out file_path. Write to a
+        # temporary file and swap it in so readers never see a partial file.
+        # Each save gets its own temporary file, since saves run on worker
+        # threads and two requests may save the same gem at once.
+        content = gem.model_dump_json(indent=2, exclude={'file_path'})
+        tmp = tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=file_path.parent,
+            prefix=f".{file_path.stem}.", suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(content)
+            # The temporary file is created 0600; keep the gem file's permissions
+            try:
+                os.chmod(tmp.name, stat.S_IMODE(os.stat(file_path).st_mode))
+            except FileNotFoundError:
+                pass
+            # Record the file before it appears under its own name; the rename
+            # keeps its mtime and size
+            saved = os.stat(tmp.name)
+            key = relative_gem_path(str(file_path))
+            _saved_stats[key] = (saved.st_mtime_ns, saved.st_size)
+            os.replace(tmp.name, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp.name)
+            except FileNotFoundError:
+                pass
+            raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving gem: {str(e)}")
 
+def invalidate_views() -> None:
+    """Drop cached responses derived from the gem store."""
+    global _export_cache, _gem_list_cache
+    _export_cache = None
+    _gem_list_cache = None
+
+def cache_gem(gem: Gem) -> None:
+    """Add or replace a gem in the in-memory store."""
+    star_rating = gem.file_path.split('/', 1)[0]
+    previous = _GEMS.get(gem.file_path)
+    star_gems = _GEMS_BY_STAR.setdefault(star_rating, {})
+    if previous is not None:
+        star_gems.pop(previous.name, None)
+    _GEMS[gem.file_path] = gem
+    star_gems[gem.name] = gem
+    _gem_json_cache.pop(gem.file_path, None)
+    invalidate_views()
+
+def iter_gem_files():
+    """Yield the path of every gem JSON file, one star directory at a time.
+    
+    Uses os.scandir so directory entries come with their type already known,
+    avoiding the extra stat() calls made by Path.iterdir()/glob().
+    """
+    with os.scandir(DATA_DIR) as it:
+        star_dirs = sorted(
+            (entry for entry in it if entry.is_dir()), key=lambda entry: entry.name
+        )
+    
+    for star_dir in star_dirs:
+        with os.scandir(star_dir.path) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield Path(entry.path)
+
+async def load_all_gems() -> None:
+    """Load every gem under DATA_DIR into the in-memory store.
+    
+    Files are read and parsed on worker threads so the reads overlap.
+    """
+    _GEMS.clear()
+    _GEMS_BY_STAR.clear()
+    _gem_json_cache.clear()
+    invalidate_views()
+    if not DATA_DIR.exists():
+        logger.warning("Data directory not found: %s", DATA_DIR)
+        return
+    
+    file_paths = list(iter_gem_files())
+    results = await asyncio.gather(
+        *(asyncio.to_thread(load_gem, file_path) for file_path in file_paths),
+        return_exceptions=True
+    )
+    for file_path, result in zip(file_paths, results):
+        if isinstance(result, HTTPException):
+            logger.warning("Error loading %s: %s", file_path, result.detail)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            cache_gem(result)
+    
+    logger.info("Loaded %d gems from %s", len(_GEMS), DATA_DIR)
+
+def forget_gem(gem_path: str) -> None:
+    """Remove a gem from the in-memory store."""
+    gem = _GEMS.pop(gem_path, None)
+    if gem is not None:
+        star_rating = gem_path.split('/', 1)[0]
+        star_gems = _GEMS_BY_STAR.get(star_rating, {})
+        star_gems.pop(gem.name, None)
+        if not star_gems:
+            _GEMS_BY_STAR.pop(star_rating, None)
+        _gem_json_cache.pop(gem_path, None)
+        invalidate_views()
+
+def forget_star_dir(star_rating: str) -> None:
+    """Remove every gem in one star directory from the in-memory store."""
+    prefix = star_rating + '/'
+    for gem_path in [gem_path for gem_path in _GEMS if gem_path.startswith(prefix)]:
+        forget_gem(gem_path)
+
+class GemFileHandler(FileSystemEventHandler):
+    """Applies changes to gem files made outside the API to the in-memory store.
+    
+    Watchdog calls these methods on its observer thread; files are parsed there
+    and the store itself is only updated on the event loop thread.
+    
+    Star directories created, deleted or moved as a whole are rescanned or
+    dropped from their directory event: moving one out of DATA_DIR reports no
+    events for the files inside it.
+    """
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+    
+    def _gem_path(self, path: str) -> Optional[str]:
+        """Return the store key for a gem file path, or None if it isn't one."""
+        relative = relative_gem_path(path)
+        if relative is None or not relative.endswith(".json") or relative.count('/') != 1:
+            return None
+        return relative
+    
+    def _star_dir(self, path: str) -> Optional[str]:
+        """Return the star rating for a star directory path, or None if it isn't one."""
+        relative = relative_gem_path(path)
+        if not relative or '/' in relative:
+            return None
+        return relative
+    
+    def _refresh(self, path: str) -> None:
+        gem_path = self._gem_path(path)
+        if gem_path is None:
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        # Editors that rewrite in place truncate first; wait for the content.
+        # Files written by save_gem are already in the store.
+        if st.st_size == 0 or _saved_stats.get(gem_path) == (st.st_mtime_ns, st.st_size):
+            return
+        try:
+            gem = load_gem(Path(path))
+        except HTTPException as e:
+            logger.warning("Error reloading %s: %s", path, e.detail)
+            return
+        self.loop.call_soon_threadsafe(cache_gem, gem)
+    
+    def _forget(self, path: str) -> None:
+        gem_path = self._gem_path(path)
+        if gem_path is not None:
+            self.loop.call_soon_threadsafe(forget_gem, gem_path)
+    
+    def _refresh_dir(self, path: str) -> None:
+        if self._star_dir(path) is None:
+            return
+        try:
+            with os.scandir(path) as it:
+                gem_files = [entry.path for entry in it if entry.name.endswith(".json") and entry.is_file()]
+        except OSError:
+            return
+        for gem_file in gem_files:
+            self._refresh(gem_file)
+    
+    def _forget_dir(self, path: str) -> None:
+        star_rating = self._star_dir(path)
+        if star_rating is not None:
+            self.loop.call_soon_threadsafe(forget_star_dir, star_rating)
+    
+    def on_created(self, event):
+        if event.is_directory:
+            self._refresh_dir(event.src_path)
+        else:
+            self._refresh(event.src_path)
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._refresh(event.src_path)
+    
+    def on_deleted(self, event):
+        if event.is_directory:
+            self._forget_dir(event.src_path)
+        else:
+            self._forget(event.src_path)
+    
+    def on_moved(self, event):
+        if event.is_directory:
+            self._forget_dir(event.src_path)
+            self._refresh_dir(event.dest_path)
+        else:
+            self._forget(event.src_path)
+            self._refresh(event.dest_path)
+
 @app.post("/auth/google", response_model=TokenResponse)
 async def google_auth(request: GoogleAuthRequest):
     """Authenticate with Google OAuth token."""
-    user = verify_google_token(request.credential)
+    # Verification may fetch Google's certificates; keep it off the event loop
+    user = await asyncio.to_thread(verify_google_token, request.credential)
     access_token = create_access_token(user)
     return TokenResponse(access_token=access_token, token_type="bearer")
 
-@app.get("/gems", response_model=List[GemListItem])
-def list_gems() -> List[GemListItem]:
-    """List all gems with their basic information."""
-    print(f"DATA_DIR is: {DATA_DIR}")
-    print(f"DATA_DIR exists: {DATA_DIR.exists()}")
-    print(f"DATA_DIR contents: {list(DATA_DIR.iterdir()) if DATA_DIR.exists() else 'directory not found'}")
+# Effects with these conditions are left out of the /gems summary
+_LIST_SKIP_CONDITIONS = frozenset({'resonance', 'combat_rating'})
+
+def build_gem_list() -> CachedBody:
+    """Serialize the /gems summary of every gem, sorted by stars then name.
     
+    Items are built as plain dicts, skipping GemListItem construction; the
+    model only documents the shape.
+    """
     gems = []
     
-    for star_dir in ["1star", "2star", "5star"]:
-        star_path = DATA_DIR / star_dir
-        print(f"Checking {star_path}, exists: {star_path.exists()}")
-        if not star_path.exists():
-            continue
+    for gem in _GEMS.values():
+        try:
+            effects = []
+            for effect in gem.ranks["1"].effects:
+                # Skip resonance and combat rating effects
+                if not _LIST_SKIP_CONDITIONS.isdisjoint(effect.conditions):
+                    continue
+                effects.append(effect.description)
+                    
+            gems.append({
+                "name": gem.name,
+                "stars": int(gem.stars),
+                "description": gem.description,
+                "effects": effects,
+                "file_path": gem.file_path
+            })
+        except Exception as e:
+            logger.warning("Error listing %s: %s", gem.file_path, e)
             
-        for file_path in star_path.glob("*.json"):
-            try:
-                gem = load_gem(file_path)
-                effects = []
-                for effect in gem.ranks["1"].effects:
-                    # Skip resonance and combat rating effects
-                    if any(cond in effect.conditions for cond in ['resonance', 'combat_rating']):
-                        continue
-                    effects.append(effect.description)
-                        
-                gems.append(GemListItem(
-                    name=gem.name,
-                    stars=int(gem.stars),
-                    description=gem.description,
-                    effects=effects,
-                    file_path=str(file_path.relative_to(DATA_DIR))
-                ))
-            except Exception as e:
-                print(f"Error loading {file_path}: {e}")
-                
-    return sorted(gems, key=lambda g: (g.stars, g.name))
+    gems.sort(key=lambda g: (g["stars"], g["name"]))
+    return cached_body(gems)
+
+@app.get("/gems", response_model=List[GemListItem])
+async def list_gems(request: Request) -> Response:
+    """List all gems with their basic information."""
+    global _gem_list_cache
+    if _gem_list_cache is None:
+        _gem_list_cache = build_gem_list()
+    return cached_response(request, _gem_list_cache)
 
 @app.get("/gems/{gem_path:path}", response_model=Gem)
-def get_gem(gem_path: str) -> Gem:
+async def get_gem(gem_path: str, request: Request) -> Response:
     """Get a specific gem by its path."""
-    file_path = DATA_DIR / gem_path
-    return load_gem(file_path)
+    cached = _gem_json_cache.get(gem_path)
+    if cached is None:
+        gem = _GEMS.get(gem_path)
+        if gem is None:
+            raise HTTPException(status_code=404, detail="Gem not found")
+        cached = _gem_json_cache[gem_path] = cached_body(gem.model_dump())
+    return cached_response(request, cached)
 
 @app.put("/gems/{gem_path:path}", response_model=Gem)
-async def update_gem(gem_path: str, gem: Gem, current_user: UserInfo = Depends(get_current_user)):
+async def update_gem(gem_path: str, gem: Gem, current_user: UserInfo = Depends(get_current_user)) -> ORJSONResponse:
     """Update a specific gem."""
     # Extract star rating and convert name to snake case
     if not gem_path[0].isdigit():
@@ -214,39 +473,50 @@ async def update_gem(gem_path: str, gem: Gem, current_user: UserInfo = Depends(g
     star_rating = f"{gem_path[0]}star"
     gem_name = convert_to_snake_case(gem_path.split('/')[-1])
     
-    # Build paths
-    gem_dir = os.path.join(DATA_DIR, star_rating)
-    
     try:
         # Build file path
-        file_path = Path(os.path.join(gem_dir, f"{gem_name}.json"))
+        star_dir = STAR_DIRS.get(star_rating)
+        file_path = star_dir / f"{gem_name}.json" if star_dir else None
         
         # Ensure the gem exists
-        if not file_path.exists():
+        if file_path is None or not file_path.exists():
             raise HTTPException(status_code=404, detail="Gem not found")
         
-        # Save the gem
-        save_gem(file_path, gem)
-        return gem
+        # Save the gem, then cache the request model as-is: FastAPI has already
+        # validated it, so re-reading the file would only validate it again.
+        # The watcher skips the file save_gem writes.
+        gem = gem.model_copy(update={"file_path": f"{star_rating}/{gem_name}.json"})
+        await asyncio.to_thread(save_gem, file_path, gem)
+        cache_gem(gem)
+        return ORJSONResponse(content=gem.model_dump())
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/effect-types")
-def get_effect_types() -> Dict[str, List[str]]:
+# The effect types never change at runtime, so the response is encoded once
+_EFFECT_TYPES_JSON = orjson.dumps({
+    "types": [e.value for e in GemEffectType],
+    "descriptions": [
+        "Triggered effects (e.g., on attack, on dash)",
+        "Passive stat bonuses",
+        "Direct damage effects",
+        "Positive effects on self/allies",
+        "Negative effects on enemies",
+        "Defensive/absorb effects",
+        "Summon temporary allies/effects",
+        "Misc utility effects"
+    ]
+})
+
+@app.get("/effect-types", response_model=Dict[str, List[str]])
+async def get_effect_types() -> Response:
     """Get all effect types and their descriptions."""
-    return {
-        "types": [e.value for e in GemEffectType],
-        "descriptions": [
-            "Triggered effects (e.g., on attack, on dash)",
-            "Passive stat bonuses",
-            "Direct damage effects",
-            "Positive effects on self/allies",
-            "Negative effects on enemies",
-            "Defensive/absorb effects",
-            "Summon temporary allies/effects",
-            "Misc utility effects"
-        ]
-    }
+    return Response(
+        content=_EFFECT_TYPES_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 @app.get("/export", response_model=Dict[str, Dict[str, Gem]])
 async def export_gems():
@@ -258,24 +528,20 @@ async def export_gems():
     Raises:
         HTTPException: If there's an error reading the data
     """
+    global _export_cache
     try:
         if not DATA_DIR.exists():
             raise HTTPException(
                 status_code=500,
                 detail=f"Data directory not found: {DATA_DIR}"
             )
-            
-        all_gems = {}
-        for star_dir in DATA_DIR.iterdir():
-            if star_dir.is_dir():
-                star_rating = star_dir.name
-                all_gems[star_rating] = {}
-                
-                for gem_file in star_dir.glob("*.json"):
-                    gem_data = load_gem(gem_file)
-                    all_gems[star_rating][gem_data["name"]] = gem_data
-                    
-        return all_gems
+        
+        if _export_cache is None:
+            _export_cache = orjson.dumps({
+                star_rating: {name: gem.model_dump() for name, gem in star_gems.items()}
+                for star_rating, star_gems in _GEMS_BY_STAR.items()
+            })
+        return Response(content=_export_cache, media_type="application/json")
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -23,3 +23,7 @@ class TokenPayload(BaseModel):
     exp: int = Field(..., description="Token expiration timestamp")
     iat: int = Field(..., description="Token issued at timestamp")
     jti: str = Field(..., description="Unique token identifier")
+
+class GoogleAuthRequest(BaseModel):
+    """Request model for Google OAuth authentication."""
+    credential: str = Field(..., description="Google OAuth credential token")
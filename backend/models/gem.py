@@ -1,33 +1,55 @@
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
-from datetime import datetime
-from .gem_types import GemEffectType, GemCondition
+from typing import Dict, List
+from pydantic import BaseModel, ConfigDict, Field
 
-class GemMetadata(BaseModel):
-    version: str
-    last_updated: datetime
+class Effect(BaseModel):
+    """Represents a gem effect with its type, description, and conditions."""
+    type: str = Field(..., description="Type of the effect")
+    description: str = Field(..., description="Description of the effect")
+    conditions: List[str] = Field(default_factory=list, description="Conditions for the effect")
+    
+    model_config = ConfigDict(
+        extra="allow",
+        json_schema_extra={
+            "examples": [
+                {
+                    "type": "resonance",
+                    "description": "Increases damage",
+                    "conditions": ["When health is above 50%"]
+                }
+            ]
+        },
+    )
 
-class GemEffect(BaseModel):
-    type: GemEffectType
-    description: str
-    conditions: Optional[List[GemCondition]] = None
-    value: Optional[float] = None
-    duration: Optional[float] = None
-    cooldown: Optional[float] = None
+class Rank(BaseModel):
+    """Represents a gem rank with its effects."""
+    effects: List[Effect] = Field(..., description="List of effects at this rank")
+    
+    model_config = ConfigDict(extra="allow")
 
-class GemRank(BaseModel):
-    effects: List[GemEffect]
+class GemMetadata(BaseModel):
+    """Metadata information for a gem."""
+    version: str = Field(..., description="Version of the gem data")
+    last_updated: str = Field(..., description="Last update timestamp")
+    
+    model_config = ConfigDict(extra="allow")
 
 class Gem(BaseModel):
-    name: str
-    stars: str  # Changed to str since it's a string in the JSON
-    description: str = ""  # Made optional with default empty string
-    metadata: GemMetadata
-    ranks: Dict[str, GemRank]
+    """Represents a complete gem with all its attributes."""
+    metadata: GemMetadata = Field(..., description="Gem metadata")
+    name: str = Field(..., description="Name of the gem")
+    stars: str = Field(..., description="Star rating of the gem")
+    description: str = Field(default="", description="Description of the gem")
+    ranks: Dict[str, Rank] = Field(..., description="Ranks and their effects")
+    file_path: str = Field(..., description="Path to the gem's JSON file")
+    
+    model_config = ConfigDict(extra="allow")
 
 class GemListItem(BaseModel):
-    name: str
-    stars: int  # Keep as int for frontend
-    description: str
-    effects: List[str]
-    file_path: str = Field(default='')
+    """Basic information about a gem for list views."""
+    model_config = ConfigDict(frozen=True)
+    
+    name: str = Field(..., description="Name of the gem")
+    stars: int = Field(..., description="Star rating of the gem")
+    description: str = Field(..., description="Brief description of the gem")
+    effects: List[str] = Field(default_factory=list, description="List of main effects")
+    file_path: str = Field(..., description="Path to the gem's JSON file")
@@ -0,0 +1,17 @@
+import os
+from pathlib import Path
+from typing import Iterator
+
+STAR_DIRS = ['1star', '2star', '5star']
+
+def iter_gem_files(data_dir: str = 'data') -> Iterator[Path]:
+    """Yield every gem JSON file in the 1star, 2star and 5star directories, skipping missing ones."""
+    for star_dir in STAR_DIRS:
+        try:
+            it = os.scandir(os.path.join(data_dir, star_dir))
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name.endswith('.json') and entry.is_file():
+                    yield Path(entry.path)
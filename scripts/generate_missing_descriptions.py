@@ -1,18 +1,70 @@
 #!/usr/bin/env python3
 
-import json
 from pathlib import Path
 import re
+from typing import Optional
+
+import orjson
+
+# Gem files that shipped without a description
+MISSING_FILES = [
+    "data/1star/entropic_well.json",
+    "data/1star/havoc_bearer.json",
+    "data/1star/hearthstone.json",
+    "data/1star/los_focused_gaze.json",
+    "data/1star/misery_elixir.json",
+    "data/2star/cold_confidant.json",
+    "data/2star/exigent_echo.json",
+    "data/2star/eye_of_the_unyielding.json",
+    "data/2star/grim_rhythm.json",
+    "data/2star/igneous_scorn.json",
+    "data/2star/ironbane.json",
+    "data/2star/lucent_watcher.json",
+    "data/2star/mercys_harvest.json",
+    "data/2star/mossthorn.json",
+    "data/2star/mothers_lament.json",
+    "data/2star/mourneskull.json",
+    "data/2star/pain_clasp.json",
+    "data/2star/unrefined_passage.json",
+    "data/2star/vipers_bite.json",
+    "data/5star/gloom_cask.json",
+    "data/5star/golden_firmament.json",
+    "data/5star/hilt_of_many_realms.json",
+    "data/5star/maw_of_the_deep.json",
+    "data/5star/roiling_consequence.json",
+    "data/5star/spiteful_blood.json",
+    "data/5star/starfire_shard.json",
+    "data/5star/stormvault.json",
+    "data/5star/tear_of_the_comet.json",
+    "data/5star/void_spark.json",
+    "data/5star/wulfheort.json"
+]
+
+# Values replaced by parameterize_value, matched in a single pass. A number
+# followed by '%' or ' seconds' becomes X% or Ts; otherwise a 'by ' or '+'
+# prefix turns it into X or Y. Unprefixed numbers must carry a unit, so the
+# engine backtracks over them exactly as the separate substitutions did.
+VALUE_RE = re.compile(
+    r'(?P<prefix>by |\+)\d+(?:\.\d+)?(?P<unit>%| seconds)?'
+    r'|\d+(?:\.\d+)?(?P<bare_unit>%| seconds)'
+)
+UNIT_PLACEHOLDERS = {'%': 'X%', ' seconds': 'Ts'}
+PREFIX_PLACEHOLDERS = {'by ': 'by X', '+': '+Y'}
+
+def _parameterize_match(match: re.Match) -> str:
+    """Return the placeholder for one VALUE_RE match."""
+    prefix = match.group('prefix')
+    if prefix is None:
+        return UNIT_PLACEHOLDERS[match.group('bare_unit')]
+    unit = match.group('unit')
+    if unit is None:
+        return PREFIX_PLACEHOLDERS[prefix]
+    return prefix + UNIT_PLACEHOLDERS[unit]
 
 def parameterize_value(value: str) -> str:
     """Convert specific values to parameters."""
     # Replace numeric values with variables
-    value = re.sub(r'(\d+(?:\.\d+)?)%', 'X%', value)
-    value = re.sub(r'(\d+(?:\.\d+)?) seconds', 'Ts', value)
-    value = re.sub(r'every (\d+(?:\.\d+)?) seconds', 'every Cs', value)
-    value = re.sub(r'by (\d+(?:\.\d+)?)', 'by X', value)
-    value = re.sub(r'\+(\d+(?:\.\d+)?)', '+Y', value)
-    return value
+    return VALUE_RE.sub(_parameterize_match, value)
 
 def get_max_rank_effects(gem_data: dict) -> list:
     """Get effects from the highest rank."""
@@ -45,20 +97,24 @@ def generate_description(gem_data: dict) -> str:
     else:
         return ", ".join(descriptions[:-1]) + f", and {descriptions[-1]}"
 
+def add_missing_description(data: dict) -> Optional[str]:
+    """Generate a description if the gem has none; return it, or None if unchanged."""
+    if 'description' in data:
+        return None
+    description = generate_description(data)
+    data['description'] = description
+    return description
+
 def update_gem_file(file_path: Path) -> None:
     """Update a single gem file with a generated description."""
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = orjson.loads(file_path.read_bytes())
             
         # Generate description if one doesn't exist
-        if 'description' not in data:
-            description = generate_description(data)
-            data['description'] = description
-            
+        description = add_missing_description(data)
+        if description is not None:
             # Write back the updated data
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             print(f"✓ {data['name']}: {description}")
         else:
             print(f"! {data['name']}: Already has description")
@@ -67,41 +123,8 @@ def update_gem_file(file_path: Path) -> None:
         print(f"✗ Error processing {file_path.name}: {e}")
 
 def main():
-    missing_files = [
-        "data/1star/entropic_well.json",
-        "data/1star/havoc_bearer.json",
-        "data/1star/hearthstone.json",
-        "data/1star/los_focused_gaze.json",
-        "data/1star/misery_elixir.json",
-        "data/2star/cold_confidant.json",
-        "data/2star/exigent_echo.json",
-        "data/2star/eye_of_the_unyielding.json",
-        "data/2star/grim_rhythm.json",
-        "data/2star/igneous_scorn.json",
-        "data/2star/ironbane.json",
-        "data/2star/lucent_watcher.json",
-        "data/2star/mercys_harvest.json",
-        "data/2star/mossthorn.json",
-        "data/2star/mothers_lament.json",
-        "data/2star/mourneskull.json",
-        "data/2star/pain_clasp.json",
-        "data/2star/unrefined_passage.json",
-        "data/2star/vipers_bite.json",
-        "data/5star/gloom_cask.json",
-        "data/5star/golden_firmament.json",
-        "data/5star/hilt_of_many_realms.json",
-        "data/5star/maw_of_the_deep.json",
-        "data/5star/roiling_consequence.json",
-        "data/5star/spiteful_blood.json",
-        "data/5star/starfire_shard.json",
-        "data/5star/stormvault.json",
-        "data/5star/tear_of_the_comet.json",
-        "data/5star/void_spark.json",
-        "data/5star/wulfheort.json"
-    ]
-    
     print("Generating descriptions for missing gems...\n")
-    for file_path in missing_files:
+    for file_path in MISSING_FILES:
         update_gem_file(Path(file_path))
 
 if __name__ == '__main__':
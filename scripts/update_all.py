@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Run all gem data updates in a single pass over the gem files.
+
+Applies update_descriptions.py, generate_missing_descriptions.py and
+update_effect_types.py to each gem in turn, so every file is read once and
+written at most once. Run from the backend directory.
+"""
+
+import os
+from pathlib import Path
+from typing import List
+
+import orjson
+
+from gem_files import iter_gem_files
+from generate_missing_descriptions import MISSING_FILES, add_missing_description
+from update_descriptions import GEM_RANKS_CSV, apply_description, load_gem_descriptions
+from update_effect_types import update_effects
+
+# Gems that get a generated description when they have none
+GENERATE_FOR = frozenset(Path(p) for p in MISSING_FILES)
+
+def update_gem_file(file_path: Path, descriptions: dict, missing: List[str]) -> None:
+    """Apply every update to a single gem file, writing it only if it changed."""
+    try:
+        data = orjson.loads(file_path.read_bytes())
+        modified = False
+
+        # Description from the CSV, then a generated one if there is still none
+        if data['name'] in descriptions:
+            modified |= apply_description(data, descriptions)
+        else:
+            missing.append(data['name'])
+        if file_path in GENERATE_FOR and add_missing_description(data) is not None:
+            modified = True
+
+        # Effect types, conditions and numeric values
+        modified |= update_effects(data)
+
+        if modified:
+            file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            print(f"✓ Updated {data['name']}")
+        else:
+            print(f"- Skipped {data['name']} (no changes needed)")
+
+    except Exception as e:
+        print(f"✗ Error processing {file_path.name}: {e}")
+
+def main():
+    # Load descriptions from CSV, if present
+    if os.path.exists(GEM_RANKS_CSV):
+        print("Loading descriptions from CSV...")
+        descriptions = load_gem_descriptions()
+    else:
+        print(f"{GEM_RANKS_CSV} not found, keeping existing descriptions")
+        descriptions = {}
+
+    gem_files = list(iter_gem_files())
+    missing = []
+
+    print(f"\nUpdating {len(gem_files)} gems...\n")
+    for file_path in gem_files:
+        update_gem_file(file_path, descriptions, missing)
+
+    if descriptions:
+        print("\nGems missing descriptions:")
+        for gem in sorted(missing):
+            print(f"✗ {gem}")
+
+    print("\nDone!")
+
+if __name__ == '__main__':
+    main()
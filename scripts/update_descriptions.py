@@ -1,10 +1,22 @@
 #!/usr/bin/env python3
 
 import csv
-import json
 import os
 import re
-from pathlib import Path
+
+import orjson
+
+from gem_files import iter_gem_files
+
+GEM_RANKS_CSV = 'docs/GemRanks.csv'
+
+# Value patterns replaced by parameterize_description, compiled once
+PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+BASE_DAMAGE_RE = re.compile(r'(\d+(?:\.\d+)?)% base damage \+ (\d+)')
+DURATION_RE = re.compile(r'for (\d+(?:\.\d+)?) seconds?')
+COOLDOWN_RE = re.compile(r'every (\d+(?:\.\d+)?) seconds')
+DAMAGE_EQUAL_RE = re.compile(r'damage equal to (\d+(?:\.\d+)?)%')
+BY_PERCENT_RE = re.compile(r'by (\d+(?:\.\d+)?)%')
 
 def parameterize_description(desc: str) -> str:
     """Convert specific values in descriptions to parameterized versions.
@@ -16,78 +28,89 @@ def parameterize_description(desc: str) -> str:
     - "Cannot occur more often than once every 20 seconds" -> "Cannot occur more often than once every Cs"
     """
     # Replace percentage values
-    desc = re.sub(r'(\d+(?:\.\d+)?)%', 'X%', desc)
+    desc = PERCENT_RE.sub('X%', desc)
     
     # Replace base damage additions
-    desc = re.sub(r'(\d+(?:\.\d+)?)% base damage \+ (\d+)', 'X% base damage + Y', desc)
+    desc = BASE_DAMAGE_RE.sub('X% base damage + Y', desc)
     
     # Replace time durations (but not cooldowns)
-    desc = re.sub(r'for (\d+(?:\.\d+)?) seconds?', 'for Ts', desc)
+    desc = DURATION_RE.sub('for Ts', desc)
     
     # Replace cooldown times
-    desc = re.sub(r'every (\d+(?:\.\d+)?) seconds', 'every Cs', desc)
+    desc = COOLDOWN_RE.sub('every Cs', desc)
     
     # Replace specific damage values
-    desc = re.sub(r'damage equal to (\d+(?:\.\d+)?)%', 'damage equal to X%', desc)
+    desc = DAMAGE_EQUAL_RE.sub('damage equal to X%', desc)
     
     # Replace specific stat values without base damage
-    desc = re.sub(r'by (\d+(?:\.\d+)?)%', 'by X%', desc)
+    desc = BY_PERCENT_RE.sub('by X%', desc)
     
     return desc
 
 def load_gem_descriptions():
-    """Load gem descriptions from the CSV file."""
+    """Load raw gem descriptions from the CSV file.
+    
+    Descriptions are parameterized later, and only for gems that exist.
+    """
     descriptions = {}
-    with open('docs/GemRanks.csv', 'r') as f:
-        reader = csv.DictReader(f)
+    with open(GEM_RANKS_CSV, 'r') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return descriptions
+        name_idx = header.index('Name')
+        max_idx = header.index('Max')
+        
         for row in reader:
-            name = row['Name']
+            # Skip blank lines and rows without a Max column
+            if len(row) <= max(name_idx, max_idx):
+                continue
             # Get the max rank description which is the most complete
-            max_desc = row['Max']
+            max_desc = row[max_idx]
             if max_desc:
                 # Clean up the description
-                max_desc = max_desc.strip('"')
-                # Parameterize the description
-                max_desc = parameterize_description(max_desc)
-                descriptions[name] = max_desc
+                descriptions[row[name_idx]] = max_desc.strip('"')
     return descriptions
 
+def apply_description(gem_data: dict, descriptions: dict) -> bool:
+    """Set a gem's description from the CSV; return True if it changed."""
+    description = parameterize_description(descriptions[gem_data['name']])
+    if gem_data.get('description') == description:
+        return False
+    gem_data['description'] = description
+    return True
+
 def update_gem_files(descriptions):
     """Update gem JSON files with descriptions from CSV."""
-    data_dir = Path('data')
     updated = []
+    unchanged = []
     missing = []
     
-    # Process each star rating directory
-    for star_dir in ['1star', '2star', '5star']:
-        star_path = data_dir / star_dir
-        if not star_path.exists():
-            continue
+    # Process each gem file in each star rating directory
+    for gem_file in iter_gem_files():
+        try:
+            # Load the current gem data
+            gem_data = orjson.loads(gem_file.read_bytes())
             
-        # Process each gem file in the directory
-        for gem_file in star_path.glob('*.json'):
-            try:
-                # Load the current gem data
-                with open(gem_file, 'r') as f:
-                    gem_data = json.load(f)
+            # Find the matching description
+            gem_name = gem_data['name']
+            if gem_name in descriptions:
+                # Add or update the description, leaving the file alone if it
+                # already has this one
+                if not apply_description(gem_data, descriptions):
+                    unchanged.append(gem_name)
+                    continue
                 
-                # Find the matching description
-                gem_name = gem_data['name']
-                if gem_name in descriptions:
-                    # Add or update the description
-                    gem_data['description'] = descriptions[gem_name]
-                    
-                    # Write back the updated data
-                    with open(gem_file, 'w') as f:
-                        json.dump(gem_data, f, indent=2)
-                    updated.append(gem_name)
-                else:
-                    missing.append(gem_name)
-                    
-            except Exception as e:
-                print(f"Error processing {gem_file}: {e}")
+                # Write back the updated data
+                gem_file.write_bytes(orjson.dumps(gem_data, option=orjson.OPT_INDENT_2))
+                updated.append(gem_name)
+            else:
+                missing.append(gem_name)
+                
+        except Exception as e:
+            print(f"Error processing {gem_file}: {e}")
     
-    return updated, missing
+    return updated, unchanged, missing
 
 def main():
     # Load descriptions from CSV
@@ -96,12 +119,16 @@ def main():
     
     # Update gem files
     print("\nUpdating gem files...")
-    updated, missing = update_gem_files(descriptions)
+    updated, unchanged, missing = update_gem_files(descriptions)
     
     print("\nUpdated gems:")
     for gem in sorted(updated):
         print(f"✓ {gem}")
     
+    print("\nGems already up to date:")
+    for gem in sorted(unchanged):
+        print(f"- {gem}")
+    
     print("\nGems missing descriptions:")
     for gem in sorted(missing):
         print(f"✗ {gem}")
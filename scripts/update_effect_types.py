@@ -1,19 +1,69 @@
 #!/usr/bin/env python3
+"""Recategorize gem effects and extract their numeric values.
+
+Run from the backend directory. The work here is string matching and JSON
+I/O, not numerics, so Numba (@jit/@njit) does not apply: it cannot compile
+str or re code and would fall back to object mode, which is slower than
+plain Python. Speed comes from precompiled patterns, substring checks,
+memoization and orjson instead.
+"""
 
-import json
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Tuple
+
+import orjson
 
 # Add backend directory to Python path
 backend_dir = Path(__file__).parent.parent / 'backend'
 sys.path.append(str(backend_dir))
 
 from models.gem_types import GemEffectType, GemCondition
+from gem_files import iter_gem_files
+
+# Description rules per effect type, checked in order of specificity. Plain
+# keywords are tested as substrings; only the patterns that need a regex
+# (one combined alternation per type) go through the regex engine.
+EFFECT_TYPE_RULES = (
+    (GemEffectType.DAMAGE,
+     ('explosion', 'critical hit'),
+     re.compile(r'deal.*damage|damage.*increased|damage.*by \d+%')),
+    (GemEffectType.SHIELD,
+     ('shield', 'absorb', 'barrier', 'protection', 'defense'),
+     None),
+    (GemEffectType.SUMMON,
+     ('summon', 'conjure', 'spawn', 'create'),
+     re.compile(r'call.*forth')),
+    (GemEffectType.DEBUFF,
+     ('reduce', 'decrease', 'slow', 'weaken'),
+     re.compile(r'take.*more damage')),
+    (GemEffectType.BUFF,
+     ('increase your', 'increases your', 'gain', 'grant you', 'grants you',
+      'improved', 'attack speed', 'movement speed'),
+     None),
+)
+
+# Condition strings kept by normalization; GemCondition values are the strings
+# used in the gem files
+VALID_CONDITIONS = frozenset(c.value for c in GemCondition)
 
-def determine_effect_type(description: str, conditions: List[str]) -> GemEffectType:
-    """Determine the effect type based on description and conditions."""
+# Numeric values pulled out by extract_numeric_values, one named group per key.
+# The alternatives cannot overlap, so one pass finds the first of each.
+NUMERIC_RE = re.compile(
+    r'(?P<value>\d+(?:\.\d+)?)%'
+    r'|for (?P<duration>\d+(?:\.\d+)?) seconds'
+    r'|every (?P<cooldown>\d+(?:\.\d+)?) seconds'
+)
+
+@lru_cache(maxsize=4096)
+def determine_effect_type(description: str, conditions: Tuple[str, ...]) -> GemEffectType:
+    """Determine the effect type based on description and conditions.
+    
+    Cached, since the same effect text recurs across ranks and gems;
+    conditions is a tuple so the arguments are hashable.
+    """
     desc_lower = description.lower()
     
     # Check conditions first
@@ -23,86 +73,16 @@ def determine_effect_type(description: str, conditions: List[str]) -> GemEffectT
     if any(c in conditions for c in ['on_attack', 'on_dash', 'on_skill', 'on_damage_taken', 'on_kill']):
         return GemEffectType.PROC
 
-    # Check description patterns
-    damage_patterns = [
-        r'deal.*damage',
-        r'damage.*increased',
-        r'damage.*by \d+%',
-        r'explosion',
-        r'critical hit'
-    ]
-    
-    buff_patterns = [
-        r'increases? your',
-        r'gain',
-        r'grants? you',
-        r'improved',
-        r'attack speed',
-        r'movement speed'
-    ]
-    
-    debuff_patterns = [
-        r'reduces?',
-        r'decreased?',
-        r'slow',
-        r'weaken',
-        r'take.*more damage'
-    ]
-    
-    shield_patterns = [
-        r'shield',
-        r'absorb',
-        r'barrier',
-        r'protection',
-        r'defense'
-    ]
-    
-    summon_patterns = [
-        r'summon',
-        r'conjure',
-        r'spawn',
-        r'create',
-        r'call.*forth'
-    ]
-
-    # Check patterns in order of specificity
-    for pattern in damage_patterns:
-        if re.search(pattern, desc_lower):
-            return GemEffectType.DAMAGE
-            
-    for pattern in shield_patterns:
-        if re.search(pattern, desc_lower):
-            return GemEffectType.SHIELD
-            
-    for pattern in summon_patterns:
-        if re.search(pattern, desc_lower):
-            return GemEffectType.SUMMON
-            
-    for pattern in debuff_patterns:
-        if re.search(pattern, desc_lower):
-            return GemEffectType.DEBUFF
-            
-    for pattern in buff_patterns:
-        if re.search(pattern, desc_lower):
-            return GemEffectType.BUFF
+    # Check description rules in order of specificity
+    for effect_type, keywords, pattern in EFFECT_TYPE_RULES:
+        for keyword in keywords:
+            if keyword in desc_lower:
+                return effect_type
+        if pattern is not None and pattern.search(desc_lower):
+            return effect_type
 
     return GemEffectType.UTILITY
 
-def normalize_condition(condition: str) -> Optional[GemCondition]:
-    """Convert condition string to GemCondition enum."""
-    condition_map = {
-        'on_attack': GemCondition.ON_ATTACK,
-        'on_dash': GemCondition.ON_DASH,
-        'on_skill': GemCondition.ON_SKILL,
-        'on_damage_taken': GemCondition.ON_DAMAGE_TAKEN,
-        'on_kill': GemCondition.ON_KILL,
-        'life_threshold': GemCondition.LIFE_THRESHOLD,
-        'cooldown_restriction': GemCondition.COOLDOWN_RESTRICTION,
-        'resonance': GemCondition.RESONANCE,
-        'combat_rating': GemCondition.COMBAT_RATING
-    }
-    return condition_map.get(condition)
-
 def extract_numeric_values(description: str) -> Dict[str, float]:
     """Extract numeric values from effect description."""
     values = {
@@ -111,58 +91,52 @@ def extract_numeric_values(description: str) -> Dict[str, float]:
         'cooldown': None
     }
     
-    # Extract percentage values
-    pct_match = re.search(r'(\d+(?:\.\d+)?)%', description)
-    if pct_match:
-        values['value'] = float(pct_match.group(1))
-    
-    # Extract duration
-    duration_match = re.search(r'for (\d+(?:\.\d+)?) seconds', description)
-    if duration_match:
-        values['duration'] = float(duration_match.group(1))
-    
-    # Extract cooldown
-    cooldown_match = re.search(r'every (\d+(?:\.\d+)?) seconds', description)
-    if cooldown_match:
-        values['cooldown'] = float(cooldown_match.group(1))
+    # Keep the first percentage, duration and cooldown found
+    for match in NUMERIC_RE.finditer(description):
+        key = match.lastgroup
+        if values[key] is None:
+            values[key] = float(match.group(key))
     
     return values
 
+def update_effects(data: dict) -> bool:
+    """Recategorize a gem's effects in place; return True if anything changed."""
+    modified = False
+    for rank in data['ranks'].values():
+        for effect in rank['effects']:
+            # Always recategorize effects
+            conditions = effect.get('conditions', [])
+            effect_type = determine_effect_type(effect['description'], tuple(conditions))
+            
+            # Update effect type
+            # GemEffectType is a str enum, so members compare equal to their values
+            if effect['type'] != effect_type:
+                effect['type'] = effect_type.value
+                modified = True
+            
+            # Normalize conditions
+            if conditions:
+                normalized = [c for c in conditions if c in VALID_CONDITIONS]
+                if normalized != conditions:
+                    effect['conditions'] = normalized
+                    modified = True
+            
+            # Extract numeric values
+            values = extract_numeric_values(effect['description'])
+            for key, value in values.items():
+                if value is not None and effect.get(key) != value:
+                    effect[key] = value
+                    modified = True
+    
+    return modified
+
 def update_gem_file(file_path: Path) -> None:
     """Update a single gem file with new effect types."""
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            
-        modified = False
-        for rank in data['ranks'].values():
-            for effect in rank['effects']:
-                # Always recategorize effects
-                conditions = effect.get('conditions', [])
-                effect_type = determine_effect_type(effect['description'], conditions)
-                
-                # Update effect type
-                if effect['type'] != effect_type.value:
-                    effect['type'] = effect_type.value
-                    modified = True
-                
-                # Normalize conditions
-                if conditions:
-                    normalized = [c.value for c in map(normalize_condition, conditions) if c is not None]
-                    if normalized != conditions:
-                        effect['conditions'] = normalized
-                        modified = True
-                
-                # Extract numeric values
-                values = extract_numeric_values(effect['description'])
-                for key, value in values.items():
-                    if value is not None and effect.get(key) != value:
-                        effect[key] = value
-                        modified = True
+        data = orjson.loads(file_path.read_bytes())
         
-        if modified:
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+        if update_effects(data):
+            file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             print(f"✓ Updated {data['name']}")
         else:
             print(f"- Skipped {data['name']} (no changes needed)")
@@ -172,10 +146,7 @@ def update_gem_file(file_path: Path) -> None:
 
 def main():
     # Get all gem files
-    data_dir = Path('data')
-    gem_files = []
-    for star_dir in ['1star', '2star', '5star']:
-        gem_files.extend(data_dir.joinpath(star_dir).glob('*.json'))
+    gem_files = list(iter_gem_files())
     
     print(f"Updating effect types for {len(gem_files)} gems...\n")
     for file_path in gem_files: